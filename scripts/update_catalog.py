@@ -13,6 +13,7 @@ What it does:
 
 Important behavior:
 - If there are **0 launches** for the selected day, the script does **nothing** (no file updates).
+- GraphQL results are cached under .cache/ph/: past days indefinitely, today for 5 minutes.
 
 Env vars:
 - PRODUCTHUNT_TOKEN (required)
@@ -22,19 +23,60 @@ Env vars:
 
 from __future__ import annotations
 
-import html
+import base64
+import gzip
+import hashlib
+import http.client
+import io
 import json
 import os
 import re
+import stat
 import sys
+import tempfile
+import threading
+import time
+from array import array
+from calendar import monthrange
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from statistics import median
+from typing import Any, Callable
+from urllib.parse import unquote, urlsplit
+from urllib.request import getproxies, proxy_bypass
 from zoneinfo import ZoneInfo
-from urllib.request import Request, urlopen
+
+try:
+    import orjson
+except ImportError:  # optional: faster GraphQL (de)serialization
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # optional: vectorized stats for large days
+    np = None
 
 
 PH_ENDPOINT = "https://api.producthunt.com/v2/api/graphql"
+_PH_URL = urlsplit(PH_ENDPOINT)
 README_PATH = "README.md"
+ARCHIVE_CACHE_PATH = ".archive_cache.json"
+# Bump whenever _render_month's output changes, so cached months re-render.
+ARCHIVE_CACHE_VERSION = 1
+
+# On-disk GraphQL cache (one entry per day's cursor chain); entries for a day
+# that is still running expire after PH_CACHE_TTL seconds.
+PH_CACHE_DIR = os.path.join(".cache", "ph")
+PH_CACHE_TTL = 300
+
+# Below this many posts the pure-Python stats path is faster than numpy.
+NUMPY_MIN_POSTS = 500
+
+# Posts per GraphQL page.
+PAGE_SIZE = 100
 
 START_TODAY = "<!-- START:PH_TODAY -->"
 END_TODAY = "<!-- END:PH_TODAY -->"
@@ -42,6 +84,22 @@ END_TODAY = "<!-- END:PH_TODAY -->"
 START_ARCHIVE = "<!-- START:ARCHIVE -->"
 END_ARCHIVE = "<!-- END:ARCHIVE -->"
 
+_BLOCK_PATTERNS = {
+    (s, e): re.compile(re.escape(s) + r".*?" + re.escape(e), flags=re.DOTALL)
+    for s, e in [(START_TODAY, END_TODAY), (START_ARCHIVE, END_ARCHIVE)]
+}
+
+_MD_TABLE = str.maketrans({"\n": " ", "|": "\\|"})
+# Same escapes as html.escape(quote=True), plus newline -> <br>.
+_HTML_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+    "\n": "<br>",
+})
+
 
 QUERY_POSTS = r"""
 query Posts($first: Int, $after: String, $postedAfter: DateTime, $postedBefore: DateTime) {
@@ -50,7 +108,6 @@ query Posts($first: Int, $after: String, $postedAfter: DateTime, $postedBefore:
     edges {
       node {
         id
-        slug
         name
         tagline
         description
@@ -71,7 +128,7 @@ def iso_z(dt: datetime) -> str:
 
 def md_escape_text(s: str) -> str:
     # Escape for Markdown tables (NOT HTML).
-    return (s or "").replace("\n", " ").replace("|", "\\|").strip()
+    return (s or "").translate(_MD_TABLE).strip()
 
 
 def safe_link(label: str, url: str) -> str:
@@ -87,9 +144,9 @@ def html_compact(s: str) -> str:
     s = (s or "").strip()
     if not s:
         return ""
-    s = html.escape(s)
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    return s.replace("\n", "<br>")
+    if "\r" in s:
+        s = s.replace("\r\n", "\n").replace("\r", "\n")
+    return s.translate(_HTML_TABLE)
 
 
 def website_icon_link(website: str) -> str:
@@ -123,27 +180,118 @@ def build_description_cell(tagline: str, description: str) -> str:
     )
 
 
+_local = threading.local()
+
+
+def _new_ph_connection() -> http.client.HTTPSConnection:
+    # Honour HTTPS_PROXY / NO_PROXY like urlopen does: CONNECT through the
+    # proxy and run TLS to the API inside the tunnel.
+    proxy = getproxies().get("https")
+    if not proxy or proxy_bypass(_PH_URL.hostname):
+        return http.client.HTTPSConnection(_PH_URL.netloc, timeout=45)
+
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    p = urlsplit(proxy)
+    headers = {}
+    if p.username:
+        cred = f"{unquote(p.username)}:{unquote(p.password or '')}"
+        headers["Proxy-Authorization"] = "Basic " + base64.b64encode(cred.encode("utf-8")).decode("ascii")
+    conn = http.client.HTTPSConnection(p.hostname, p.port or 80, timeout=45)
+    conn.set_tunnel(_PH_URL.hostname, _PH_URL.port or 443, headers=headers)
+    return conn
+
+
+def _ph_connection() -> http.client.HTTPSConnection:
+    # One keep-alive connection per thread, reused across pages.
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _new_ph_connection()
+        _local.conn = conn
+    return conn
+
+
+def _ph_post(payload: bytes, headers: dict) -> tuple[int, bytes, str]:
+    for attempt in (1, 2):
+        conn = _ph_connection()
+        try:
+            conn.request("POST", _PH_URL.path, body=payload, headers=headers)
+            resp = conn.getresponse()
+            raw = resp.read()
+        except (http.client.HTTPException, ConnectionError):
+            # The server may have closed an idle keep-alive connection.
+            conn.close()
+            _local.conn = None
+            if attempt == 2:
+                raise
+            continue
+        if resp.getheader("Content-Encoding", "").lower() == "gzip":
+            raw = gzip.decompress(raw)
+        return resp.status, raw, resp.reason
+    raise AssertionError("unreachable")
+
+
 def ph_call(token: str, query: str, variables: dict) -> dict:
-    payload = json.dumps({"query": query, "variables": variables}).encode("utf-8")
-    req = Request(
-        PH_ENDPOINT,
-        data=payload,
+    body = {"query": query, "variables": variables}
+    payload = orjson.dumps(body) if orjson else json.dumps(body).encode("utf-8")
+    status, raw, reason = _ph_post(
+        payload,
         headers={
             "Accept": "application/json",
+            "Accept-Encoding": "gzip",
             "Content-Type": "application/json",
             "Authorization": f"Bearer {token}",
         },
-        method="POST",
     )
-    raw = urlopen(req, timeout=45).read().decode("utf-8")
-    out = json.loads(raw)
+    if status >= 400:
+        raise RuntimeError(f"HTTP {status} {reason}: {raw[:500].decode('utf-8', 'replace')}")
+    out = orjson.loads(raw) if orjson else json.loads(raw.decode("utf-8"))
     if out.get("errors"):
         raise RuntimeError(json.dumps(out["errors"], ensure_ascii=False))
     return out.get("data") or {}
 
 
+@lru_cache(maxsize=8)
+def _tz(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+def _cache_is_fresh(path: str, day_end: str) -> bool:
+    # Entries written after the day ended hold final data and never expire.
+    # While the day runs, entries live PH_CACHE_TTL seconds; anything written
+    # before the day ended is stale once it has.
+    mtime = os.stat(path).st_mtime
+    end = datetime.fromisoformat(day_end.replace("Z", "+00:00")).timestamp()
+    if mtime >= end:
+        return True
+    now = time.time()
+    return now < end and now - mtime < PH_CACHE_TTL
+
+
+def _cached_fetch(key: dict, day_end: str, fetch: Callable[[], Any]) -> Any:
+    digest = hashlib.blake2b(
+        json.dumps(key, sort_keys=True).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    path = os.path.join(PH_CACHE_DIR, f"{digest}.json")
+
+    try:
+        if _cache_is_fresh(path, day_end):
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    data = fetch()
+    try:
+        write_text(path, json.dumps(data, ensure_ascii=False))
+    except OSError:
+        pass
+    return data
+
+
 def get_target_day(tz_name: str) -> tuple[datetime, datetime, str, str, str]:
-    tz = ZoneInfo(tz_name)
+    tz = _tz(tz_name)
 
     override = (os.getenv("DATE") or "").strip()
     if override:
@@ -161,16 +309,16 @@ def get_target_day(tz_name: str) -> tuple[datetime, datetime, str, str, str]:
     return start, end, label, year, month
 
 
-def fetch_posts_for_day(token: str, start_local: datetime, end_local: datetime) -> list[dict]:
+def _fetch_pages(token: str, posted_after: str, posted_before: str) -> list[dict]:
     after = None
     items: list[dict] = []
 
     while True:
         vars_ = {
-            "first": 50,
+            "first": PAGE_SIZE,
             "after": after,
-            "postedAfter": iso_z(start_local),
-            "postedBefore": iso_z(end_local),
+            "postedAfter": posted_after,
+            "postedBefore": posted_before,
         }
         data = ph_call(token, QUERY_POSTS, vars_)
         conn = (data.get("posts") or {})
@@ -191,6 +339,19 @@ def fetch_posts_for_day(token: str, start_local: datetime, end_local: datetime)
     return items
 
 
+def fetch_posts_for_day(token: str, start_local: datetime, end_local: datetime) -> list[dict]:
+    posted_after = iso_z(start_local)
+    posted_before = iso_z(end_local)
+
+    # The whole cursor chain is cached as one entry, so a run never mixes
+    # pages fetched at different times.
+    return _cached_fetch(
+        {"query": QUERY_POSTS, "day": [posted_after, posted_before], "first": PAGE_SIZE},
+        posted_before,
+        lambda: _fetch_pages(token, posted_after, posted_before),
+    )
+
+
 @dataclass
 class DailyStats:
     launches: int
@@ -200,32 +361,55 @@ class DailyStats:
     total_comments: int
     avg_comments: float
     median_comments: float
+    sorted_posts: list[dict]  # by votes, descending
+
+
+def prepare_posts(posts: list[dict]) -> None:
+    # Parse counts and escape table cells once per post; stats and every
+    # rendered table read the cached values.
+    for p in posts:
+        p["_votes"] = int(p.get("votesCount") or 0)
+        p["_comments"] = int(p.get("commentsCount") or 0)
+
+        # safe_link escapes its label itself.
+        name = p.get("name") or ""
+        ph_url = (p.get("url") or "").strip()
+        p["_app_cell"] = safe_link(name, ph_url) if ph_url else md_escape_text(name)
+        p["_desc_cell"] = build_description_cell(p.get("tagline") or "", p.get("description") or "")
+        p["_website_cell"] = website_icon_link(p.get("website") or "")
 
 
 def compute_daily_stats(posts: list[dict]) -> DailyStats:
-    votes = [int(p.get("votesCount") or 0) for p in posts]
-    comments = [int(p.get("commentsCount") or 0) for p in posts]
+    # Single pass over posts; expects prepare_posts() to have run.
     n = len(posts)
 
-    votes_sorted = sorted(votes)
-    comments_sorted = sorted(comments)
-
-    total_votes = sum(votes)
-    total_comments = sum(comments)
+    if np is not None and n >= NUMPY_MIN_POSTS:
+        votes = np.fromiter((p["_votes"] for p in posts), dtype=np.int64, count=n)
+        comments = np.fromiter((p["_comments"] for p in posts), dtype=np.int64, count=n)
+        total_votes = int(votes.sum())
+        total_comments = int(comments.sum())
+        median_votes = float(np.median(votes))
+        median_comments = float(np.median(comments))
+    else:
+        votes = array("q", bytes(8 * n))
+        comments = array("q", bytes(8 * n))
+        total_votes = 0
+        total_comments = 0
+
+        for i, p in enumerate(posts):
+            v = p["_votes"]
+            c = p["_comments"]
+            votes[i] = v
+            comments[i] = c
+            total_votes += v
+            total_comments += c
+
+        median_votes = float(median(votes)) if n else 0.0
+        median_comments = float(median(comments)) if n else 0.0
 
     avg_votes = (total_votes / n) if n else 0.0
     avg_comments = (total_comments / n) if n else 0.0
 
-    if n == 0:
-        median_votes = 0.0
-        median_comments = 0.0
-    elif n % 2 == 1:
-        median_votes = float(votes_sorted[n // 2])
-        median_comments = float(comments_sorted[n // 2])
-    else:
-        median_votes = (votes_sorted[n // 2 - 1] + votes_sorted[n // 2]) / 2.0
-        median_comments = (comments_sorted[n // 2 - 1] + comments_sorted[n // 2]) / 2.0
-
     return DailyStats(
         launches=n,
         total_votes=total_votes,
@@ -234,33 +418,23 @@ def compute_daily_stats(posts: list[dict]) -> DailyStats:
         total_comments=total_comments,
         avg_comments=avg_comments,
         median_comments=median_comments,
+        sorted_posts=sorted(posts, key=itemgetter("_votes"), reverse=True),
     )
 
 
-def render_posts_table(posts: list[dict]) -> str:
-    lines: list[str] = []
-    lines.append("| # | App | Description | Votes | Comments | Website |")
-    lines.append("|---:|---|---|---:|---:|---|")
-
-    posts_sorted = sorted(posts, key=lambda p: int(p.get("votesCount") or 0), reverse=True)
+def render_posts_table(posts_sorted: list[dict]) -> str:
+    # Expects posts already sorted by votes (DailyStats.sorted_posts) and
+    # passed through prepare_posts().
+    buf = io.StringIO()
+    buf.write("| # | App | Description | Votes | Comments | Website |\n")
+    buf.write("|---:|---|---|---:|---:|---|\n")
 
     for i, p in enumerate(posts_sorted, 1):
-        name = md_escape_text(p.get("name") or "")
-        ph_url = (p.get("url") or "").strip()
-        app_cell = safe_link(name, ph_url) if ph_url else name
-
-        desc_cell = build_description_cell(p.get("tagline") or "", p.get("description") or "")
-
-        votes = int(p.get("votesCount") or 0)
-        comments = int(p.get("commentsCount") or 0)
-
-        website_cell = website_icon_link(p.get("website") or "")
-
-        lines.append(
-            f"| {i} | {app_cell} | {desc_cell} | {votes} | {comments} | {website_cell} |"
+        buf.write(
+            f"| {i} | {p['_app_cell']} | {p['_desc_cell']} | {p['_votes']} | {p['_comments']} | {p['_website_cell']} |\n"
         )
 
-    return "\n".join(lines) + "\n"
+    return buf.getvalue()
 
 
 def ensure_dir(path: str) -> None:
@@ -268,71 +442,154 @@ def ensure_dir(path: str) -> None:
 
 
 def write_text(path: str, content: str) -> None:
-    ensure_dir(os.path.dirname(path) or ".")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
+    # Write to a temp file in the same directory and swap it in atomically,
+    # so an interrupted run never leaves a truncated file behind.
+    dirn = os.path.dirname(path) or "."
+    ensure_dir(dirn)
+    fd, tmp = tempfile.mkstemp(dir=dirn, prefix=".tmp_")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_text_if_changed(path: str, content: str) -> bool:
+    # Returns False (and leaves the file untouched) when it already holds `content`.
+    try:
+        with open(path, "rb") as f:
+            if f.read() == content.encode("utf-8"):
+                return False
+    except FileNotFoundError:
+        pass
+    write_text(path, content)
+    return True
 
 
 def replace_block(text: str, start: str, end: str, new_block: str) -> str:
-    pattern = re.compile(re.escape(start) + r".*?" + re.escape(end), flags=re.DOTALL)
+    pattern = _BLOCK_PATTERNS.get((start, end))
+    if pattern is None:
+        pattern = re.compile(re.escape(start) + r".*?" + re.escape(end), flags=re.DOTALL)
     replacement = f"{start}\n{new_block}\n{end}"
-    if pattern.search(text):
-        return pattern.sub(replacement, text, count=1)
+    m = pattern.search(text)
+    if m:
+        # Spliced in literally (post text may contain backslashes); skip
+        # rebuilding the text when the block is already up to date.
+        if m.group(0) == replacement:
+            return text
+        return text[:m.start()] + replacement + text[m.end():]
     return text.rstrip() + "\n\n" + replacement + "\n"
 
 
-def scan_archive_nav() -> str:
-    years: list[str] = []
-    for entry in os.listdir("."):
-        if entry.isdigit() and len(entry) == 4 and os.path.isdir(entry):
-            years.append(entry)
-    years.sort(reverse=True)
-
-    if not years:
-        return "_No reports yet._"
+def _report_sort_key(fn: str) -> tuple[int, int, int]:
+    # DD-MM-YYYY.md -> (YYYY, MM, DD); unparsable names and impossible dates
+    # sort last.
+    try:
+        d, mm, yy = fn[:-3].split("-")
+        key = (int(yy), int(mm), int(d))
+    except ValueError:
+        return (0, 0, 0)
+    year, month, day = key
+    if not (1 <= year <= 9999 and 1 <= month <= 12 and 1 <= day <= monthrange(year, month)[1]):
+        return (0, 0, 0)
+    return key
+
+
+def _render_month(y: str, m: str, month_dir: str) -> str:
+    with os.scandir(month_dir) as it:
+        files = sorted(
+            (e.name for e in it if e.is_file() and e.name.lower().endswith(".md")),
+            key=_report_sort_key,
+            reverse=True,
+        )
 
     lines: list[str] = []
-    for y in years:
-        months: list[str] = []
-        for m in os.listdir(y):
-            if m.isdigit() and len(m) == 2 and os.path.isdir(os.path.join(y, m)):
-                months.append(m)
-        months.sort(reverse=True)
+    lines.append("  <details>")
+    lines.append(f"  <summary>{m}</summary>\n")
 
-        lines.append("<details>")
-        lines.append(f"<summary>{y}</summary>\n")
+    if not files:
+        lines.append("  _Empty_\n")
+        lines.append("  </details>\n")
+        return "\n".join(lines)
 
-        for m in months:
-            month_dir = os.path.join(y, m)
-            files = [f for f in os.listdir(month_dir) if f.lower().endswith(".md")]
+    for fn in files:
+        rel = f"{y}/{m}/{fn}"
+        title = fn[:-3]
+        lines.append(f"  - [{title}]({rel})")
 
-            def sort_key(fn: str):
-                base = fn[:-3]
-                try:
-                    d, mm, yy = base.split("-")
-                    return datetime(int(yy), int(mm), int(d))
-                except Exception:
-                    return datetime.min
+    lines.append("\n  </details>\n")
+    return "\n".join(lines)
 
-            files.sort(key=sort_key, reverse=True)
 
-            lines.append("  <details>")
-            lines.append(f"  <summary>{m}</summary>\n")
+def _load_archive_cache() -> dict:
+    try:
+        with open(ARCHIVE_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # A cache written by another _render_month format is a miss as a whole.
+    if not isinstance(cache, dict) or cache.get("version") != ARCHIVE_CACHE_VERSION:
+        return {}
+    months = cache.get("months")
+    return months if isinstance(months, dict) else {}
 
-            if not files:
-                lines.append("  _Empty_\n")
-                lines.append("  </details>\n")
-                continue
 
-            for fn in files:
-                rel = f"{y}/{m}/{fn}"
-                title = fn[:-3]
-                lines.append(f"  - [{title}]({rel})")
+def scan_archive_nav() -> str:
+    with os.scandir(".") as it:
+        years = [e for e in it if e.is_dir() and e.name.isdigit() and len(e.name) == 4]
+    years.sort(key=attrgetter("name"), reverse=True)
 
-            lines.append("\n  </details>\n")
+    if not years:
+        return "_No reports yet._"
+
+    # Month listings only change when a file is added/removed, which bumps the
+    # directory mtime, so unchanged months reuse their cached HTML.
+    cache = _load_archive_cache()
+    new_cache: dict[str, dict] = {}
+
+    lines: list[str] = []
+    for year_entry in years:
+        y = year_entry.name
+        with os.scandir(year_entry.path) as it:
+            months = [e for e in it if e.is_dir() and e.name.isdigit() and len(e.name) == 2]
+        months.sort(key=attrgetter("name"), reverse=True)
+
+        lines.append("<details>")
+        lines.append(f"<summary>{y}</summary>\n")
+
+        for month_entry in months:
+            m = month_entry.name
+            key = f"{y}/{m}"
+            mtime = month_entry.stat().st_mtime_ns
+            hit = cache.get(key)
+            if isinstance(hit, dict) and hit.get("mtime") == mtime and isinstance(hit.get("html"), str):
+                month_html = hit["html"]
+            else:
+                month_html = _render_month(y, m, month_entry.path)
+            new_cache[key] = {"mtime": mtime, "html": month_html}
+            lines.append(month_html)
 
         lines.append("</details>\n")
 
+    if new_cache != cache:
+        try:
+            write_text(
+                ARCHIVE_CACHE_PATH,
+                json.dumps({"version": ARCHIVE_CACHE_VERSION, "months": new_cache}, ensure_ascii=False),
+            )
+        except OSError:
+            pass
+
     return "\n".join(lines).rstrip() + "\n"
 
 
@@ -340,48 +597,53 @@ def build_daily_report_md(
     tz_name: str,
     label_dd_mm_yyyy: str,
     stats: DailyStats,
-    posts: list[dict],
     rel_link_to_today: str,
 ) -> str:
     header = f"# Product Hunt — launches for {label_dd_mm_yyyy}\n"
     sub = f"_Timezone for “today”: `{tz_name}`. Source: Product Hunt API._\n\n"
     follow_me = "[![Follow me on Product Hunt](https://img.shields.io/badge/Follow%20me%20on%20Product%20Hunt-@nbox-orange?style=for-the-badge)](https://www.producthunt.com/@nbox)\n\n"
 
-    summary = []
-    summary.append("## Summary\n")
-    summary.append(f"- Launches: **{stats.launches}**")
-    summary.append(f"- Total votes: **{stats.total_votes}**")
-    summary.append(f"- Avg / Median votes: **{stats.avg_votes:.2f} / {stats.median_votes:.2f}**")
-    summary.append(f"- Total comments: **{stats.total_comments}**")
-    summary.append(f"- Avg / Median comments: **{stats.avg_comments:.2f} / {stats.median_comments:.2f}**")
-    summary.append(f"- Report file: {safe_link(label_dd_mm_yyyy, rel_link_to_today)}")
-    summary.append("\n")
-
-    launches = []
-    launches.append("## Launches (sorted by votes)\n")
-    launches.append(render_posts_table(posts))
-
-    return header + follow_me + "\n".join(summary) + "\n" + "\n".join(launches)
-
+    parts = [
+        header,
+        follow_me,
+        "## Summary\n\n",
+        f"- Launches: **{stats.launches}**\n",
+        f"- Total votes: **{stats.total_votes}**\n",
+        f"- Avg / Median votes: **{stats.avg_votes:.2f} / {stats.median_votes:.2f}**\n",
+        f"- Total comments: **{stats.total_comments}**\n",
+        f"- Avg / Median comments: **{stats.avg_comments:.2f} / {stats.median_comments:.2f}**\n",
+        f"- Report file: {safe_link(label_dd_mm_yyyy, rel_link_to_today)}\n",
+        "\n\n",
+        "## Launches (sorted by votes)\n\n",
+        render_posts_table(stats.sorted_posts),
+    ]
+    return "".join(parts)
 
 
 def build_today_readme_block(
     tz_name: str,
     label_dd_mm_yyyy: str,
     stats: DailyStats,
-    posts: list[dict],
     rel_link_to_today: str,
 ) -> str:
-    lines: list[str] = []
-    lines.append(f"### {label_dd_mm_yyyy} ({tz_name})\n")
-    lines.append(f"- Launches: **{stats.launches}**")
-    lines.append(f"- Total votes: **{stats.total_votes}**")
-    lines.append(f"- Avg / Median votes: **{stats.avg_votes:.2f} / {stats.median_votes:.2f}**")
-    lines.append(f"- Total comments: **{stats.total_comments}**")
-    lines.append(f"- Avg / Median comments: **{stats.avg_comments:.2f} / {stats.median_comments:.2f}**")
-    lines.append(f"- Full report: {safe_link(label_dd_mm_yyyy, rel_link_to_today)}\n")
-    lines.append(render_posts_table(posts))
-    return "\n".join(lines).rstrip() + "\n"
+    parts = [
+        f"### {label_dd_mm_yyyy} ({tz_name})\n\n",
+        f"- Launches: **{stats.launches}**\n",
+        f"- Total votes: **{stats.total_votes}**\n",
+        f"- Avg / Median votes: **{stats.avg_votes:.2f} / {stats.median_votes:.2f}**\n",
+        f"- Total comments: **{stats.total_comments}**\n",
+        f"- Avg / Median comments: **{stats.avg_comments:.2f} / {stats.median_comments:.2f}**\n",
+        f"- Full report: {safe_link(label_dd_mm_yyyy, rel_link_to_today)}\n\n",
+        render_posts_table(stats.sorted_posts),
+    ]
+    return "".join(parts)
+
+
+def _read_readme() -> str | None:
+    if not os.path.exists(README_PATH):
+        return None
+    with open(README_PATH, "r", encoding="utf-8") as f:
+        return f.read()
 
 
 def main() -> int:
@@ -394,50 +656,60 @@ def main() -> int:
 
     start_local, end_local, label, year, month = get_target_day(tz_name)
 
-    posts = fetch_posts_for_day(token, start_local, end_local)
+    with ThreadPoolExecutor(max_workers=1) as io_pool:
+        # README read is independent of the network fetch; start it right away.
+        fut_readme = io_pool.submit(_read_readme)
 
-    # If there are no launches yet, do not touch files at all.
-    if not posts:
-        print("No launches found for today. Skipping all updates.")
-        return 0
+        posts = fetch_posts_for_day(token, start_local, end_local)
 
-    stats = compute_daily_stats(posts)
+        # If there are no launches yet, do not touch files at all.
+        if not posts:
+            print("No launches found for today. Skipping all updates.")
+            return 0
 
-    daily_filename = f"{label}.md"
-    daily_path = os.path.join(year, month, daily_filename)
-    rel_link_to_today = f"{year}/{month}/{daily_filename}"
+        prepare_posts(posts)
+        stats = compute_daily_stats(posts)
 
-    daily_md = build_daily_report_md(
-        tz_name=tz_name,
-        label_dd_mm_yyyy=label,
-        stats=stats,
-        posts=posts,
-        rel_link_to_today=rel_link_to_today,
-    )
-    write_text(daily_path, daily_md)
-    print(f"Wrote/updated: {daily_path}")
+        daily_filename = f"{label}.md"
+        daily_path = os.path.join(year, month, daily_filename)
+        rel_link_to_today = f"{year}/{month}/{daily_filename}"
 
-    if not os.path.exists(README_PATH):
+        daily_md = build_daily_report_md(
+            tz_name=tz_name,
+            label_dd_mm_yyyy=label,
+            stats=stats,
+            rel_link_to_today=rel_link_to_today,
+        )
+        fut_daily = io_pool.submit(write_text_if_changed, daily_path, daily_md)
+
+        today_block = build_today_readme_block(
+            tz_name=tz_name,
+            label_dd_mm_yyyy=label,
+            stats=stats,
+            rel_link_to_today=rel_link_to_today,
+        )
+
+        # The archive scan must see today's file, so join the write first.
+        if fut_daily.result():
+            print(f"Wrote/updated: {daily_path}")
+        else:
+            print(f"Unchanged: {daily_path}")
+
+        readme = fut_readme.result()
+
+    if readme is None:
         print("README.md not found. Create it first.", file=sys.stderr)
         return 3
 
-    with open(README_PATH, "r", encoding="utf-8") as f:
-        readme = f.read()
-
-    today_block = build_today_readme_block(
-        tz_name=tz_name,
-        label_dd_mm_yyyy=label,
-        stats=stats,
-        posts=posts,
-        rel_link_to_today=rel_link_to_today,
-    )
     archive_block = scan_archive_nav()
 
     readme = replace_block(readme, START_TODAY, END_TODAY, today_block)
     readme = replace_block(readme, START_ARCHIVE, END_ARCHIVE, archive_block)
 
-    write_text(README_PATH, readme)
-    print("README updated")
+    if write_text_if_changed(README_PATH, readme):
+        print("README updated")
+    else:
+        print("README unchanged")
 
     return 0
 